@@ -6,6 +6,8 @@ Requisitos:
 -----------
 - Python 3.9+
 - Pygame 2.x  →  pip install pygame
+- NumPy       →  pip install numpy
+- Numba (opcional, acelera el movimiento con cientos de coches)
 
 
 
@@ -23,24 +25,32 @@ Los coches se generan de forma pseudo‑aleatoria y respetan la luz roja.
 Estructura principal de clases:
 -------------------------------
 TrafficLight → administra el estado (ROJO, VERDE, AMARILLO).
-Car          → representa cada vehículo en pantalla.
 Spawner      → genera coches en intervalos aleatorios.
-Simulation   → bucle principal y orquestación.
+Simulation   → bucle principal y orquestación. Los coches se almacenan como
+               arrays NumPy (estructura de arrays) para actualizarlos en bloque.
 
 El código está completamente comentado en español para facilitar el aprendizaje.
 """
 
-import random
 import sys
-from enum import Enum, auto
-from dataclasses import dataclass
+from enum import IntEnum, auto
 from typing import Tuple, List
+import numpy as np
 import pygame
 
+# Numba es opcional: si está instalado, el núcleo de movimiento se compila a
+# código máquina (interesa con cientos de coches); si no, se usa la versión
+# vectorizada con NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # ============================ CONSTANTES GRÁFICAS ============================ #
 ANCHO_PANTALLA: int = 900
 ALTO_PANTALLA: int = 600
 FPS: int = 60
+PASO_FISICA: float = 1 / 120  # paso fijo de simulación en segundos
 
 COLOR_FONDO: Tuple[int, int, int] = (34, 40, 49)
 COLOR_CARRETERA: Tuple[int, int, int] = (50, 50, 50)
@@ -53,53 +63,157 @@ COLOR_AMARILLO: Tuple[int, int, int] = (255, 215, 0)
 COLOR_VERDE: Tuple[int, int, int] = (0, 200, 0)
 COLOR_CAJA_SEMAFORO: Tuple[int, int, int] = (20, 20, 20)
 
+# Coches
+VELOCIDAD_COCHE: float = 120.0  # píxeles por segundo
+LARGO_COCHE: int = 25
+ANCHO_COCHE: int = 15
+MAX_COCHES: int = 256  # capacidad de los arrays (con lista de huecos libres)
+MEDIO_COCHE: float = LARGO_COCHE / 2
+DISTANCIA_SEGURIDAD: float = LARGO_COCHE + 10  # separación mínima entre coches de un carril
+
+# Líneas de parada antes de la intersección (constantes de la geometría,
+# calculadas una sola vez en lugar de en cada paso de simulación)
+LINEA_PARADA_Y: float = ALTO_PANTALLA / 2 - 40
+LINEA_PARADA_X: float = ANCHO_PANTALLA / 2 - 40
+# Ventana de frenado: un coche se detiene cuando su frente está a menos de
+# esta distancia de su línea de parada
+MARGEN_PARADA: float = 5.0
+# Distancia entre la línea de parada cercana y la del sentido contrario
+ANCHO_CRUCE: float = 80.0
+LINEA_PARADA_Y_LEJANA: float = LINEA_PARADA_Y + ANCHO_CRUCE
+LINEA_PARADA_X_LEJANA: float = LINEA_PARADA_X + ANCHO_CRUCE
+
 # ============================ ENUMERACIONES & DATAS ========================== #
-class LightState(Enum):
+class LightState(IntEnum):
     VERDE = auto()
     AMARILLO = auto()
     ROJO = auto()
 
-# Direcciones cardinales simplificadas
-class Direction(Enum):
+# Direcciones cardinales simplificadas (IntEnum: comparaciones por entero
+# y utilizables directamente contra los arrays NumPy)
+class Direction(IntEnum):
     NORTE = auto()
     SUR = auto()
     ESTE = auto()
     OESTE = auto()
 
+# Vector unitario de avance por dirección, indexado por el valor del IntEnum
+# (el índice 0 no se usa). Sustituye la cascada de comparaciones por dirección
+# por una simple indexación de tabla.
+_DIR_UX = np.zeros(5, dtype=np.float32)
+_DIR_UY = np.zeros(5, dtype=np.float32)
+_DIR_UY[Direction.NORTE] = -1.0
+_DIR_UY[Direction.SUR] = 1.0
+_DIR_UX[Direction.ESTE] = 1.0
+_DIR_UX[Direction.OESTE] = -1.0
+
+# Direcciones como enteros planos para el núcleo compilable con Numba
+_I_NORTE, _I_SUR = int(Direction.NORTE), int(Direction.SUR)
+_I_ESTE, _I_OESTE = int(Direction.ESTE), int(Direction.OESTE)
+
+
+def _mover_coches(cx, cy, cdir, cspeed, alive, dt, ns_pass, ew_pass):
+    """Núcleo escalar de movimiento + parada en rojo, compilable con Numba.
+
+    Devuelve las posiciones propuestas; la misma lógica que la ruta NumPy
+    de Simulation._step_cars pero como bucle explícito por coche.
+    """
+    n = cx.shape[0]
+    nx = np.empty_like(cx)
+    ny = np.empty_like(cy)
+    for i in range(n):
+        nx[i] = cx[i]
+        ny[i] = cy[i]
+        if not alive[i]:
+            continue
+        d = cdir[i]
+        paso = cspeed[i] * dt
+        dx, dy = 0.0, 0.0
+        if d == _I_ESTE:
+            dx = paso
+        elif d == _I_OESTE:
+            dx = -paso
+        elif d == _I_SUR:
+            dy = paso
+        elif d == _I_NORTE:
+            dy = -paso
+        if not ns_pass:
+            if d == _I_NORTE:
+                frente = cy[i] - MEDIO_COCHE
+                if LINEA_PARADA_Y - MARGEN_PARADA < frente <= LINEA_PARADA_Y:
+                    dy = 0.0
+            elif d == _I_SUR:
+                frente = cy[i] + MEDIO_COCHE
+                if LINEA_PARADA_Y_LEJANA <= frente < LINEA_PARADA_Y_LEJANA + MARGEN_PARADA:
+                    dy = 0.0
+        if not ew_pass:
+            if d == _I_OESTE:
+                frente = cx[i] - MEDIO_COCHE
+                if LINEA_PARADA_X - MARGEN_PARADA < frente <= LINEA_PARADA_X:
+                    dx = 0.0
+            elif d == _I_ESTE:
+                frente = cx[i] + MEDIO_COCHE
+                if LINEA_PARADA_X_LEJANA <= frente < LINEA_PARADA_X_LEJANA + MARGEN_PARADA:
+                    dx = 0.0
+        nx[i] = cx[i] + dx
+        ny[i] = cy[i] + dy
+    return nx, ny
+
+
+if njit is not None:
+    _mover_coches = njit(cache=True)(_mover_coches)
+
+# Color de cada estado, en el mismo orden que la enumeración LightState
+_COLORES_ESTADO = (COLOR_VERDE, COLOR_AMARILLO, COLOR_ROJO)
+
+# Orden de las lámparas en la caja del semáforo, de arriba hacia abajo
+_LIGHT_ORDER = (LightState.ROJO, LightState.AMARILLO, LightState.VERDE)
+
+# Extremos de las líneas divisoras discontinuas, precalculados una sola vez
+# en lugar de rehacer la aritmética en cada llamada a draw_roads
+_GUIONES_V = [((ANCHO_PANTALLA/2, ALTO_PANTALLA/2 + o),
+               (ANCHO_PANTALLA/2, ALTO_PANTALLA/2 + o + 30))
+              for o in range(-350, 350, 60)]
+_GUIONES_H = [((ANCHO_PANTALLA/2 + o, ALTO_PANTALLA/2),
+               (ANCHO_PANTALLA/2 + o + 30, ALTO_PANTALLA/2))
+              for o in range(-350, 350, 60)]
+
 # Parámetros de ciclo del semáforo (en milisegundos)
 TIEMPO_VERDE = 6000
 TIEMPO_AMARILLO = 2000
 # El rojo se calcula implícitamente cuando la otra vía está en verde/amarillo
 
-@dataclass
+# Evento de usuario que dispara cada cambio de fase del semáforo: en lugar de
+# consultar el reloj en cada fotograma, un temporizador de pygame encola el
+# evento justo cuando toca cambiar
+EVENTO_SEMAFORO = pygame.event.custom_type()
+
+# Ciclo completo de la intersección: (estado NS, estado EW, duración en ms)
+_FASES_SEMAFORO = (
+    (LightState.VERDE, LightState.ROJO, TIEMPO_VERDE),
+    (LightState.AMARILLO, LightState.ROJO, TIEMPO_AMARILLO),
+    (LightState.ROJO, LightState.VERDE, TIEMPO_VERDE),
+    (LightState.ROJO, LightState.AMARILLO, TIEMPO_AMARILLO),
+)
+
 class TrafficLight:
     """Controla el estado del semáforo para una dirección principal"""
 
-    position: Tuple[int, int]
-    orientation: Direction  # Indica qué sentido está en verde cuando este semáforo lo está
-    last_change_ms: int = 0
-    state: LightState = LightState.VERDE
-
-    def update(self, current_ms: int):
-        """Actualiza el estado según temporizador"""
-        tiempo_en_estado = current_ms - self.last_change_ms
-        if self.state == LightState.VERDE and tiempo_en_estado >= TIEMPO_VERDE:
-            self.state = LightState.AMARILLO
-            self.last_change_ms = current_ms
-        elif self.state == LightState.AMARILLO and tiempo_en_estado >= TIEMPO_AMARILLO:
-            self.state = LightState.ROJO
-            self.last_change_ms = current_ms
-        elif self.state == LightState.ROJO and tiempo_en_estado >= TIEMPO_VERDE + TIEMPO_AMARILLO:
-            # Ciclo completo terminado -> volver a VERDE
-            self.state = LightState.VERDE
-            self.last_change_ms = current_ms
+    # __slots__ evita el diccionario por instancia: menos memoria y accesos
+    # a atributos más rápidos
+    __slots__ = ("position", "orientation", "state")
+
+    def __init__(self, position: Tuple[int, int], orientation: Direction,
+                 state: LightState = LightState.VERDE):
+        self.position = position
+        # Indica qué sentido está en verde cuando este semáforo lo está
+        self.orientation = orientation
+        self.state = state
 
     def color(self) -> Tuple[int, int, int]:
-        return {
-            LightState.VERDE: COLOR_VERDE,
-            LightState.AMARILLO: COLOR_AMARILLO,
-            LightState.ROJO: COLOR_ROJO,
-        }[self.state]
+        # Tupla indexada por valor de estado: evita construir y consultar
+        # un diccionario en cada llamada
+        return _COLORES_ESTADO[self.state - 1]
 
     def is_green_for(self, direction: Direction) -> bool:
         """Devuelve True si esta luz permite pasar al coche que viene en esa dirección"""
@@ -109,96 +223,86 @@ class TrafficLight:
             mismo_eje = self.orientation in (Direction.ESTE, Direction.OESTE)
         return mismo_eje and self.state == LightState.VERDE
 
-@dataclass
-class Car:
-    """Representa un vehículo que se desplaza en línea recta"""
-
-    direction: Direction
-    position: pygame.Vector2
-    speed: float = 120.0  # píxeles por segundo
-    length: int = 25
-    width: int = 15
+# Generador compartido para los intervalos de aparición
+_RNG = np.random.default_rng()
 
-    def update(self, dt: float, luces: List[TrafficLight]):
-        """Mueve el coche si la luz se lo permite o si ya cruzó la intersección"""
-        # Determinar eje y sentido
-        dx, dy = 0.0, 0.0
-        if self.direction == Direction.NORTE:
-            dy = -self.speed * dt
-        elif self.direction == Direction.SUR:
-            dy = self.speed * dt
-        elif self.direction == Direction.ESTE:
-            dx = self.speed * dt
-        elif self.direction == Direction.OESTE:
-            dx = -self.speed * dt
-
-        # Referencia: punto de detención antes de la intersección
-        stop_line_y = ALTO_PANTALLA / 2 - 40
-        stop_line_x = ANCHO_PANTALLA / 2 - 40
-
-        # Verificar si debe detenerse en rojo
-        for luz in luces:
-            if not luz.is_green_for(self.direction):
-                if self.direction == Direction.NORTE and self.position.y - self.length/2 <= stop_line_y:
-                    if self.position.y - self.length/2 > stop_line_y - 5:
-                        dy = 0  # Detener
-                elif self.direction == Direction.SUR and self.position.y + self.length/2 >= stop_line_y + 80:
-                    if self.position.y + self.length/2 < stop_line_y + 85:
-                        dy = 0
-                elif self.direction == Direction.OESTE and self.position.x - self.length/2 <= stop_line_x:
-                    if self.position.x - self.length/2 > stop_line_x - 5:
-                        dx = 0
-                elif self.direction == Direction.ESTE and self.position.x + self.length/2 >= stop_line_x + 80:
-                    if self.position.x + self.length/2 < stop_line_x + 85:
-                        dx = 0
-        # Actualizar posición
-        self.position.x += dx
-        self.position.y += dy
-
-    def is_off_screen(self) -> bool:
-        return (
-            self.position.x < -50 or self.position.x > ANCHO_PANTALLA + 50 or
-            self.position.y < -50 or self.position.y > ALTO_PANTALLA + 50
-        )
-
-    def rect(self) -> pygame.Rect:
-        if self.direction in (Direction.NORTE, Direction.SUR):
-            return pygame.Rect(self.position.x - self.width/2, self.position.y - self.length/2, self.width, self.length)
-        else:
-            return pygame.Rect(self.position.x - self.length/2, self.position.y - self.width/2, self.length, self.width)
 
 class Spawner:
     """Crea coches nuevos en intervalos aleatorios"""
 
+    __slots__ = ("direction", "spawn_pos", "interval_range", "next_spawn_ms",
+                 "_pool", "_pool_idx")
+
     def __init__(self, direction: Direction, spawn_pos: Tuple[int, int], interval_range=(1500, 4000)):
         self.direction = direction
         self.spawn_pos = spawn_pos
         self.interval_range = interval_range
         self.next_spawn_ms = 0
-
-    def update(self, current_ms: int, cars: List[Car]):
+        # Reserva de intervalos pre-generados en bloque: una llamada al
+        # generador cada 128 apariciones en vez de una por aparición
+        self._pool = _RNG.integers(interval_range[0], interval_range[1] + 1, size=128)
+        self._pool_idx = 0
+
+    def _siguiente_intervalo(self) -> int:
+        if self._pool_idx >= self._pool.size:
+            self._pool = _RNG.integers(self.interval_range[0], self.interval_range[1] + 1, size=128)
+            self._pool_idx = 0
+        intervalo = int(self._pool[self._pool_idx])
+        self._pool_idx += 1
+        return intervalo
+
+    def update(self, current_ms: int, sim: "Simulation"):
         if current_ms >= self.next_spawn_ms:
-            cars.append(Car(self.direction, pygame.Vector2(self.spawn_pos)))
-            self.next_spawn_ms = current_ms + random.randint(*self.interval_range)
+            sim.spawn_car(self.direction, self.spawn_pos)
+            self.next_spawn_ms = current_ms + self._siguiente_intervalo()
 
 class Simulation:
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((ANCHO_PANTALLA, ALTO_PANTALLA))
+        # vsync=1 sincroniza la presentación con el refresco del monitor
+        # (petición best-effort: si el controlador no lo admite, sin vsync)
+        flags = pygame.SCALED | pygame.DOUBLEBUF | pygame.HWSURFACE
+        try:
+            self.screen = pygame.display.set_mode(
+                (ANCHO_PANTALLA, ALTO_PANTALLA), flags, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode(
+                (ANCHO_PANTALLA, ALTO_PANTALLA), flags)
         pygame.display.set_caption("Simulador de semáforo con tráfico")
         self.clock = pygame.time.Clock()
         self.running = True
         self.paused = False
+        # La simulación solo reacciona a cerrar la ventana, al teclado y al
+        # temporizador del semáforo
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, EVENTO_SEMAFORO])
 
         # Semáforos en dos ejes⊕ simplificación: eje vertical está "gestionado" por traffic_light_ns
         self.traffic_light_ns = TrafficLight((ANCHO_PANTALLA/2 - 60, ALTO_PANTALLA/2 - 60), Direction.NORTE)
         self.traffic_light_ew = TrafficLight((ANCHO_PANTALLA/2 + 20, ALTO_PANTALLA/2 - 60), Direction.ESTE)
-        # Desfase para que no sean verdes al mismo tiempo
-        self.traffic_light_ew.state = LightState.ROJO
-        self.traffic_light_ew.last_change_ms = 0
-        self.traffic_light_ns.last_change_ms = 0
+        # Fase inicial del ciclo (NS verde, EW rojo) y temporizador de un solo
+        # disparo que encola el siguiente cambio de fase
+        self.fase_semaforo = 0
+        self._aplicar_fase()
+
+        # Coches como estructura de arrays: cada índice es un hueco fijo y los
+        # huecos sin coche se marcan en `calive`. Actualizar en bloque con NumPy
+        # evita el bucle por coche en Python (el punto caliente de la simulación).
+        self.cx = np.zeros(MAX_COCHES, dtype=np.float32)
+        self.cy = np.zeros(MAX_COCHES, dtype=np.float32)
+        self.cdir = np.zeros(MAX_COCHES, dtype=np.int8)
+        self.cspeed = np.full(MAX_COCHES, VELOCIDAD_COCHE, dtype=np.float32)
+        self.calive = np.zeros(MAX_COCHES, dtype=bool)
+        # Coches "dormidos": un coche parado no se borra ni se repinta hasta
+        # que vuelve a moverse (cmovido) ; cdibujado indica si su último
+        # rectángulo sigue en pantalla
+        self.cmovido = np.zeros(MAX_COCHES, dtype=bool)
+        self.cdibujado = np.zeros(MAX_COCHES, dtype=bool)
+        # Centro con el que se pintó el coche por última vez (para borrarlo)
+        self.cpintx = np.zeros(MAX_COCHES, dtype=np.float32)
+        self.cpinty = np.zeros(MAX_COCHES, dtype=np.float32)
+        self._free: List[int] = list(range(MAX_COCHES))
 
-        self.cars: List[Car] = []
         # Spawners en los cuatro sentidos
         self.spawners = [
             Spawner(Direction.SUR, (ANCHO_PANTALLA/2 - 20, -30)),
@@ -207,19 +311,93 @@ class Simulation:
             Spawner(Direction.OESTE, (ANCHO_PANTALLA + 30, ALTO_PANTALLA/2 - 20)),
         ]
 
-    def run(self):
+        # Fondo estático (carreteras, líneas y cajas de semáforo) pre-renderizado
+        # una sola vez: en cada fotograma basta un único blit en lugar de
+        # repetir decenas de llamadas de dibujo que nunca cambian.
+        self.bg = pygame.Surface((ANCHO_PANTALLA, ALTO_PANTALLA)).convert()
+        self.bg.fill(COLOR_FONDO)
+        self.draw_roads(self.bg)
+        self.draw_light_boxes(self.bg)
+
+        # Sprites de coche pre-renderizados (uno por orientación): dibujar el
+        # rectángulo redondeado una sola vez y luego solo copiar píxeles
+        self.sprite_coche_v = self._make_car_sprite(ANCHO_COCHE, LARGO_COCHE)
+        self.sprite_coche_h = self._make_car_sprite(LARGO_COCHE, ANCHO_COCHE)
+
+        # Rectángulos sucios: las cajas de luces se repintan siempre y los
+        # coches solo invalidan su posición anterior y la nueva. El primer
+        # fotograma repinta la pantalla completa.
+        self._rects_luces = [pygame.Rect(luz.position[0], luz.position[1], 40, 120)
+                             for luz in (self.traffic_light_ns, self.traffic_light_ew)]
+        self._rects_borrar: List[pygame.Rect] = [self.screen.get_rect()]
+
+        # Precalentar el núcleo Numba durante el arranque: compilar (o
+        # deserializar la caché) aquí y no en mitad del primer fotograma
+        if njit is not None:
+            _mover_coches(self.cx, self.cy, self.cdir, self.cspeed,
+                          self.calive, np.float32(0.0), True, True)
+
+    @staticmethod
+    def _make_car_sprite(ancho: int, alto: int) -> pygame.Surface:
+        sprite = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+        pygame.draw.rect(sprite, COLOR_COCHE, pygame.Rect(0, 0, ancho, alto), border_radius=4)
+        return sprite.convert_alpha()
+
+    def spawn_car(self, direction: Direction, pos: Tuple[float, float]):
+        """Ocupa un hueco libre de los arrays para un coche nuevo"""
+        if not self._free:
+            return  # Capacidad agotada: no generar más hasta que salga alguno
+        i = self._free.pop()
+        self.cx[i] = pos[0]
+        self.cy[i] = pos[1]
+        self.cdir[i] = direction
+        self.cspeed[i] = VELOCIDAD_COCHE
+        self.calive[i] = True
+        self.cmovido[i] = True  # un coche nuevo siempre necesita pintarse
+        self.cdibujado[i] = False
+
+    def run(self, bench_mode: bool = False):
+        # Física con paso fijo: el tiempo real se acumula y se consume en
+        # incrementos constantes, de modo que el movimiento no depende de la
+        # tasa de fotogramas (un fotograma lento ejecuta varios pasos).
+        # Con bench_mode=True no se limita la tasa de fotogramas: útil para
+        # medir el rendimiento máximo del bucle.
+        acumulador = 0.0
+        limite_fps = 0 if bench_mode else FPS
         while self.running:
-            dt = self.clock.tick(FPS) / 1000  # delta time en segundos
+            dt = self.clock.tick(limite_fps) / 1000  # delta time en segundos
             current_ms = pygame.time.get_ticks()
             self.handle_events()
-            if not self.paused:
-                self.update(dt, current_ms)
-            self.draw()
+            if self.paused:
+                # Modo perezoso: en pausa nada cambia en pantalla, así que no
+                # se borra, ni se repinta, ni se sube nada a la ventana; solo
+                # se atienden eventos cediendo la CPU al sistema
+                acumulador = 0.0
+                pygame.time.wait(1)
+                continue
+            # Evitar la espiral de la muerte tras una pausa del sistema
+            acumulador = min(acumulador + dt, 0.25)
+            while acumulador >= PASO_FISICA:
+                self.update(PASO_FISICA, current_ms)
+                acumulador -= PASO_FISICA
+            sucios = self.draw()
+            # Solo se suben a la ventana las zonas que cambiaron
+            pygame.display.update(sucios)
         pygame.quit()
         sys.exit()
 
+    def _aplicar_fase(self):
+        """Aplica la fase actual a ambos semáforos y arma el temporizador"""
+        ns, ew, duracion = _FASES_SEMAFORO[self.fase_semaforo]
+        self.traffic_light_ns.state = ns
+        self.traffic_light_ew.state = ew
+        pygame.time.set_timer(EVENTO_SEMAFORO, duracion, loops=1)
+
     def handle_events(self):
-        for event in pygame.event.get():
+        # Solo se consultan los tipos que interesan; el resto queda bloqueado
+        # en __init__ para que la cola no acumule movimiento de ratón, etc.
+        for event in pygame.event.get(
+                eventtype=[pygame.QUIT, pygame.KEYDOWN, EVENTO_SEMAFORO], pump=True):
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -227,69 +405,179 @@ class Simulation:
                     self.running = False
                 elif event.key == pygame.K_SPACE:
                     self.paused = not self.paused
+            elif event.type == EVENTO_SEMAFORO:
+                if self.paused:
+                    # En pausa las luces no avanzan: rearmar la fase actual
+                    self._aplicar_fase()
+                else:
+                    self.fase_semaforo = (self.fase_semaforo + 1) % len(_FASES_SEMAFORO)
+                    self._aplicar_fase()
 
     def update(self, dt: float, current_ms: int):
-        # Actualizar semáforos
-        self.traffic_light_ns.update(current_ms)
-        # El semáforo EW cambia cuando NS termina verde+amarillo y viceversa
-        ciclo_ns = (current_ms - self.traffic_light_ns.last_change_ms)
-        if self.traffic_light_ns.state == LightState.ROJO:
-            self.traffic_light_ew.update(current_ms)
-        else:
-            # Mantener semáforo EW en rojo cuando NS no está en rojo
-            self.traffic_light_ew.state = LightState.ROJO
-            self.traffic_light_ew.last_change_ms = current_ms
+        # Los semáforos cambian por eventos de temporizador (handle_events);
+        # aquí solo se atienden spawners y coches
 
         # Spawners
         for spawner in self.spawners:
-            spawner.update(current_ms, self.cars)
-
-        # Coches
-        for car in list(self.cars):
-            car.update(dt, [self.traffic_light_ns, self.traffic_light_ew])
-            if car.is_off_screen():
-                self.cars.remove(car)
-
-    def draw(self):
-        self.screen.fill(COLOR_FONDO)
-        self.draw_roads()
+            spawner.update(current_ms, self)
+
+        # Coches (actualización vectorizada). El permiso de paso por eje se
+        # calcula una sola vez por fotograma: es idéntico para todos los coches.
+        ns_pass = self.traffic_light_ns.state == LightState.VERDE
+        ew_pass = self.traffic_light_ew.state == LightState.VERDE
+        self._step_cars(dt, ns_pass, ew_pass)
+
+    def _step_cars(self, dt: float, ns_pass: bool, ew_pass: bool):
+        """Mueve todos los coches en bloque; los que ven rojo se detienen en la línea"""
+        cdir, alive = self.cdir, self.calive
+
+        if njit is not None:
+            # Núcleo compilado: un solo bucle en código máquina por los arrays
+            nx, ny = _mover_coches(self.cx, self.cy, cdir, self.cspeed,
+                                   alive, np.float32(dt), ns_pass, ew_pass)
+        else:
+            # Ruta NumPy: velocidad por eje según tabla de vectores unitarios
+            paso = self.cspeed * dt
+            vx = _DIR_UX[cdir] * paso
+            vy = _DIR_UY[cdir] * paso
+
+            # Máscaras de detención en rojo (mismas ventanas que la versión escalar)
+            if not ns_pass:
+                frente_n = self.cy - MEDIO_COCHE
+                stop_n = (cdir == Direction.NORTE) & (frente_n <= LINEA_PARADA_Y) & (frente_n > LINEA_PARADA_Y - MARGEN_PARADA)
+                frente_s = self.cy + MEDIO_COCHE
+                stop_s = (cdir == Direction.SUR) & (frente_s >= LINEA_PARADA_Y_LEJANA) & (frente_s < LINEA_PARADA_Y_LEJANA + MARGEN_PARADA)
+                vy = np.where(stop_n | stop_s, 0.0, vy)
+            if not ew_pass:
+                frente_o = self.cx - MEDIO_COCHE
+                stop_o = (cdir == Direction.OESTE) & (frente_o <= LINEA_PARADA_X) & (frente_o > LINEA_PARADA_X - MARGEN_PARADA)
+                frente_e = self.cx + MEDIO_COCHE
+                stop_e = (cdir == Direction.ESTE) & (frente_e >= LINEA_PARADA_X_LEJANA) & (frente_e < LINEA_PARADA_X_LEJANA + MARGEN_PARADA)
+                vx = np.where(stop_o | stop_e, 0.0, vx)
+
+            # Posición propuesta (solo huecos ocupados)
+            nx = self.cx + np.where(alive, vx, 0.0)
+            ny = self.cy + np.where(alive, vy, 0.0)
+
+        # Respetar al vehículo de delante: con cuatro flujos rectos de un solo
+        # carril basta ordenar cada carril por su eje de avance y encadenar la
+        # separación mínima con un mínimo acumulado (equivalente unidimensional
+        # de una rejilla espacial).
+        for d in (Direction.NORTE, Direction.SUR, Direction.ESTE, Direction.OESTE):
+            idx = np.nonzero(alive & (cdir == d))[0]
+            if idx.size < 2:
+                continue
+            eje = nx if d in (Direction.ESTE, Direction.OESTE) else ny
+            signo = 1.0 if d in (Direction.SUR, Direction.ESTE) else -1.0
+            orden = idx[np.argsort(-signo * eje[idx])]  # primero el que va en cabeza
+            s = signo * eje[orden]
+            holgura = DISTANCIA_SEGURIDAD * np.arange(orden.size, dtype=np.float32)
+            s = np.minimum.accumulate(s + holgura) - holgura
+            eje[orden] = signo * s
+
+        # Marcar los coches que de verdad cambiaron de posición: los parados
+        # "duermen" y no se vuelven a borrar ni pintar hasta que despierten
+        self.cmovido |= alive & ((nx != self.cx) | (ny != self.cy))
+        self.cx, self.cy = nx, ny
+
+        # Eliminación fuera de pantalla: una sola máscara
+        dentro = (self.cx > -50) & (self.cx < ANCHO_PANTALLA + 50) & \
+                 (self.cy > -50) & (self.cy < ALTO_PANTALLA + 50)
+        # Reciclar solo los huecos recién liberados (O(muertos), no O(capacidad))
+        muertos = np.nonzero(alive & ~dentro)[0]
+        if muertos.size:
+            alive[muertos] = False
+            self.cmovido[muertos] = False
+            for i in muertos:
+                if self.cdibujado[i]:
+                    self._rects_borrar.append(
+                        self._rect_coche(i, self.cpintx[i], self.cpinty[i]))
+                    self.cdibujado[i] = False
+            self._free.extend(muertos)
+
+    def _rect_coche(self, i: int, x: float, y: float) -> pygame.Rect:
+        """Rectángulo en pantalla del coche del hueco i centrado en (x, y)"""
+        # pygame.Rect no acepta escalares np.float32: convertir a float nativo
+        x, y = float(x), float(y)
+        if self.cdir[i] in (Direction.NORTE, Direction.SUR):
+            return pygame.Rect(x - ANCHO_COCHE/2, y - LARGO_COCHE/2, ANCHO_COCHE, LARGO_COCHE)
+        return pygame.Rect(x - LARGO_COCHE/2, y - ANCHO_COCHE/2, LARGO_COCHE, ANCHO_COCHE)
+
+    def draw(self) -> List[pygame.Rect]:
+        """Repinta solo las zonas que cambiaron y devuelve sus rectángulos"""
+        # Zonas a borrar: coches muertos, coches que se movieron y las cajas
+        # de luces (que se repintan siempre); los coches dormidos conservan
+        # sus píxeles del fotograma anterior
+        borrar = self._rects_borrar
+        self._rects_borrar = []
+        movidos = np.nonzero(self.calive & self.cmovido)[0]
+        for i in movidos:
+            if self.cdibujado[i]:
+                borrar.append(self._rect_coche(i, self.cpintx[i], self.cpinty[i]))
+        borrar.extend(self._rects_luces)
+        for r in borrar:
+            self.screen.blit(self.bg, r, r)
         self.draw_traffic_lights()
-        self.draw_cars()
-        pygame.display.flip()
+        pintados = self.draw_cars(movidos, borrar)
+        return borrar + pintados
 
     # --------------------------------------------------------------------- #
-    def draw_roads(self):
+    def draw_roads(self, surface: pygame.Surface):
         # Fondo de carretera horizontal
         pygame.draw.rect(
-            self.screen, COLOR_CARRETERA,
+            surface, COLOR_CARRETERA,
             pygame.Rect(0, ALTO_PANTALLA/2 - 40, ANCHO_PANTALLA, 80))
         # Fondo de carretera vertical
         pygame.draw.rect(
-            self.screen, COLOR_CARRETERA,
+            surface, COLOR_CARRETERA,
             pygame.Rect(ANCHO_PANTALLA/2 - 40, 0, 80, ALTO_PANTALLA))
-        # Líneas divisoras
-        for offset in range(-350, 350, 60):
-            pygame.draw.line(
-                self.screen, COLOR_LINEA,
-                (ANCHO_PANTALLA/2, ALTO_PANTALLA/2 + offset),
-                (ANCHO_PANTALLA/2, ALTO_PANTALLA/2 + offset + 30), 3)
-            pygame.draw.line(
-                self.screen, COLOR_LINEA,
-                (ANCHO_PANTALLA/2 + offset, ALTO_PANTALLA/2),
-                (ANCHO_PANTALLA/2 + offset + 30, ALTO_PANTALLA/2), 3)
+        # Líneas divisoras (extremos precalculados a nivel de módulo)
+        for inicio, fin in _GUIONES_V:
+            pygame.draw.line(surface, COLOR_LINEA, inicio, fin, 3)
+        for inicio, fin in _GUIONES_H:
+            pygame.draw.line(surface, COLOR_LINEA, inicio, fin, 3)
+
+    def draw_light_boxes(self, surface: pygame.Surface):
+        # Cajas de los semáforos (estáticas, van al fondo pre-renderizado)
+        for luz in (self.traffic_light_ns, self.traffic_light_ew):
+            x, y = luz.position
+            pygame.draw.rect(surface, COLOR_CAJA_SEMAFORO, pygame.Rect(x, y, 40, 120), border_radius=4)
 
     def draw_traffic_lights(self):
         for luz in (self.traffic_light_ns, self.traffic_light_ew):
             x, y = luz.position
-            # Caja del semáforo
-            pygame.draw.rect(self.screen, COLOR_CAJA_SEMAFORO, pygame.Rect(x, y, 40, 120), border_radius=4)
-            # Luces
+            # Luces (la caja ya está en el fondo)
             for i, color in enumerate((COLOR_ROJO, COLOR_AMARILLO, COLOR_VERDE)):
-                pygame.draw.circle(self.screen, color if luz.state == [LightState.ROJO, LightState.AMARILLO, LightState.VERDE][i] else (60, 60, 60), (x + 20, y + 20 + i*40), 12)
-
-    def draw_cars(self):
-        for car in self.cars:
-            pygame.draw.rect(self.screen, COLOR_COCHE, car.rect(), border_radius=4)
+                pygame.draw.circle(self.screen, color if luz.state == _LIGHT_ORDER[i] else (60, 60, 60), (x + 20, y + 20 + i*40), 12)
+
+    def draw_cars(self, movidos: np.ndarray, zonas_borradas: List[pygame.Rect]) -> List[pygame.Rect]:
+        # Un solo Surface.blits con los sprites pre-renderizados: una llamada
+        # a la API por fotograma en lugar de un draw.rect por coche. Solo se
+        # pintan los coches que se movieron; un coche dormido únicamente se
+        # repinta si el borrado de una zona sucia le comió píxeles.
+        dibujar = list(movidos)
+        dormidos = np.nonzero(self.calive & ~self.cmovido & self.cdibujado)[0]
+        for i in dormidos:
+            r = self._rect_coche(i, self.cpintx[i], self.cpinty[i])
+            if r.collidelist(zonas_borradas) != -1:
+                dibujar.append(i)
+        if not dibujar:
+            self.cmovido[:] = False
+            return []
+        vertical = (self.cdir == Direction.NORTE) | (self.cdir == Direction.SUR)
+        # Ojo: pygame no acepta escalares np.float32 como posición de blit;
+        # hay que cruzar la frontera NumPy→pygame con float nativo
+        lote = [(self.sprite_coche_v if vertical[i] else self.sprite_coche_h,
+                 (float(self.cx[i]) - (ANCHO_COCHE if vertical[i] else LARGO_COCHE) / 2,
+                  float(self.cy[i]) - (LARGO_COCHE if vertical[i] else ANCHO_COCHE) / 2))
+                for i in dibujar]
+        rects = self.screen.blits(lote)
+        for i in dibujar:
+            self.cpintx[i] = self.cx[i]
+            self.cpinty[i] = self.cy[i]
+            self.cdibujado[i] = True
+        self.cmovido[:] = False
+        return rects
 
 # =============================== EJECUCIÓN =================================== #
 if __name__ == "__main__":